@@ -0,0 +1,17 @@
+# Generated by Django 3.2 on 2026-08-29 06:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0002_auto_20260829_0626'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['author', '-date_posted'], name='post_author_date_idx'),
+        ),
+    ]
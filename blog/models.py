@@ -7,9 +7,17 @@ from django.urls import reverse
 class Post(models.Model):
     title = models.CharField(max_length=100)
     content = models.TextField()
-    date_posted = models.DateTimeField(default=timezone.now)
+    date_posted = models.DateTimeField(default=timezone.now, db_index=True)
     author = models.ForeignKey(User, on_delete=models.CASCADE)
 
+    class Meta:
+        ordering = ['-date_posted']
+        indexes = [
+            # Covers the per-author timeline in UserPostListView
+            # (filter on author, order by -date_posted).
+            models.Index(fields=['author', '-date_posted'], name='post_author_date_idx'),
+        ]
+
     def __str__(self):
         return self.title
 
@@ -1,5 +1,9 @@
+from asgiref.sync import sync_to_async
 from django.shortcuts import render, get_object_or_404
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
+from django.core.paginator import Paginator
+from django.views.decorators.cache import cache_page
+from django.views.decorators.vary import vary_on_cookie
 from django.contrib.auth.models import User
 from django.views.generic import (
     ListView,
@@ -11,19 +15,31 @@ from django.views.generic import (
 from .models import Post
 
 
-def home(request):
-    context = {
-        'posts': Post.objects.all()
-    }
-    return render(request, 'blog/home.html', context)
-
-
-class PostListView(ListView):
-    model = Post
-    template_name = 'blog/home.html'  # <app>/<model>_<viewtype>.html
-    context_object_name = 'posts'
-    ordering = ['-date_posted']
-    paginate_by = 10
+async def home(request):
+    # An async view lets one worker multiplex many concurrent requests
+    # while this one waits on the database. Django 3.2 has no async ORM,
+    # so the query and template render run in the thread pool.
+    def _render_page():
+        # The template renders post.author.profile.image, so join author
+        # and profile up front instead of querying them once per post.
+        # only() is limited to the fields home.html actually touches;
+        # anything outside the list would refetch per row.
+        posts = (
+            Post.objects
+            .select_related('author__profile')
+            .only('title', 'content', 'date_posted',
+                  'author__username', 'author__profile__image')
+            .order_by('-date_posted')
+        )
+        page = Paginator(posts, 10).get_page(request.GET.get('page'))
+        context = {
+            'posts': page,
+            'page_obj': page,
+            'is_paginated': page.has_other_pages(),
+        }
+        return render(request, 'blog/home.html', context)
+
+    return await sync_to_async(_render_page)()
 
 
 class UserPostListView(ListView):
@@ -76,5 +92,11 @@ class PostDeleteView(LoginRequiredMixin, UserPassesTestMixin, DeleteView):
         return False
 
 
+# The About page is static, so cache the whole rendered response for a
+# day instead of re-running the template engine on every request.
+# vary_on_cookie keys the cache per session: base.html renders an
+# auth-dependent navbar, so one user's page must not be served to another.
+@cache_page(60 * 60 * 24)
+@vary_on_cookie
 def about(request):
     return render(request, 'blog/about.html', {'title': 'About'})
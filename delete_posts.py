@@ -1,7 +1,28 @@
+import os
+
 from blog.models import Post
 
-def delete_posts():
-    deleted_count, _ = Post.objects.all().delete()
+def delete_posts(chunk_size=None):
+    # Post is a leaf in the schema (nothing cascades off it), so skip
+    # Django's deletion collector, which would first fetch every PK into
+    # memory. Note: pre_delete/post_delete signals do not fire here; no
+    # receiver is registered for Post.
+    if chunk_size is None:
+        chunk_size = int(os.environ.get('DELETE_CHUNK_SIZE', 0)) or None
+
+    if chunk_size:
+        # Delete in PK batches so each statement (and its transaction)
+        # stays bounded on very large tables.
+        deleted_count = 0
+        while True:
+            ids = list(Post.objects.values_list('pk', flat=True)[:chunk_size])
+            if not ids:
+                break
+            queryset = Post.objects.filter(pk__in=ids)
+            deleted_count += queryset._raw_delete(queryset.db)
+    else:
+        queryset = Post.objects.all()
+        deleted_count = queryset._raw_delete(queryset.db)
     print(f"{deleted_count} posts deleted successfully.")
 
 if __name__ == "__main__":
@@ -1,18 +1,70 @@
-import json
+import os
+from itertools import islice
+
+import ijson
+from django.contrib.auth.models import User
+from django.db import connection, transaction
+from django.utils import timezone
+
 from blog.models import Post
 
+# Rows committed per transaction; bounds the cost of a single rollback.
+CHUNK_SIZE = 10000
+
+INSERT_SQL = (
+    f"INSERT INTO {Post._meta.db_table} (title, content, date_posted, author_id) "
+    "VALUES (%s, %s, %s, %s)"
+)
+
 def populate_posts(json_file_path='posts.json'):
     # Populate new posts
-    with open(json_file_path) as f:
-        posts_json = json.load(f)
-
-    for post_data in posts_json:
-        post = Post.objects.create(
-            title=post_data.get('title', ''),
-            content=post_data.get('content', ''),
-            author_id=post_data.get('user_id', None)
-        )
-        print(f"Created Post with title: {post.title} and ID: {post.id}")
+    # Optimal batch size is engine-dependent, so allow overriding it.
+    batch_size = int(os.environ.get('POPULATE_BATCH_SIZE', 1000))
+
+    # Computed once instead of per-row via the field default.
+    now = timezone.now()
+
+    created = 0
+    skipped = 0
+    with open(json_file_path, 'rb') as f:
+        # Stream records off disk one at a time instead of json.load-ing
+        # the whole array, so peak memory is O(CHUNK_SIZE) no matter how
+        # large the seed file is.
+        records = ijson.items(f, 'item')
+        while True:
+            chunk = list(islice(records, CHUNK_SIZE))
+            if not chunk:
+                break
+
+            # Check all referenced user ids with one SELECT per chunk;
+            # letting bad rows hit the database would raise FK violations
+            # one aborted INSERT at a time.
+            wanted_ids = {p.get('user_id') for p in chunk if p.get('user_id')}
+            valid_ids = set(User.objects.filter(id__in=wanted_ids).values_list('id', flat=True))
+
+            # Build plain tuples straight from the JSON dicts; instantiating a
+            # Post per row is the dominant Python cost for large seed files.
+            rows = [
+                (
+                    post_data.get('title', ''),
+                    post_data.get('content', ''),
+                    now,
+                    post_data.get('user_id', None)
+                )
+                for post_data in chunk
+                if post_data.get('user_id') in valid_ids
+            ]
+            skipped += len(chunk) - len(rows)
+
+            with transaction.atomic():
+                with connection.cursor() as cursor:
+                    for start in range(0, len(rows), batch_size):
+                        cursor.executemany(INSERT_SQL, rows[start:start + batch_size])
+            created += len(rows)
+
+    print(f"Created {created} posts.")
+    if skipped:
+        print(f"Skipped {skipped} posts with unknown user_id.")
 
 if __name__ == "__main__":
     populate_posts()
@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.db import models
 from django.contrib.auth.models import User
 from PIL import Image
@@ -5,13 +6,24 @@ from PIL import Image
 
 class Profile(models.Model):
     user = models.OneToOneField(User, on_delete=models.CASCADE)
-    image = models.ImageField(default='default.jpg', upload_to='profile_pics')
+    image = models.ImageField(upload_to='profile_pics', null=True, blank=True)
 
     def __str__(self):
         return f'{self.user.username} Profile'
 
-    def save(self):
-        super().save()
+    @property
+    def image_url(self):
+        # Constant URL for the default avatar; going through FieldFile
+        # would stat the filesystem once per rendered avatar.
+        if self.image:
+            return self.image.url
+        return settings.MEDIA_URL + 'default.jpg'
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+
+        if not self.image:
+            return
 
         img = Image.open(self.image.path)
 
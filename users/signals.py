@@ -1,20 +1,26 @@
+from contextlib import contextmanager
+
 from .models import Profile
-from django.db import models
 from django.contrib.auth.models import User
 from django.dispatch import receiver
 from django.db.models.signals import post_save
 
-print("Signals file executed!")
-
 
 @receiver(post_save, sender=User)
 def create_profile(sender, instance, created, **kwargs):
     if created:
-        print(f"Profile created for user: {instance.username}")
         Profile.objects.create(user=instance)
 
 
-@receiver(post_save, sender=User)
-def save_profile(sender, instance, **kwargs):
-    print(f"Profile saved for user: {instance.username}")
-    instance.profile.save()
+@contextmanager
+def no_profile_signals():
+    # Suspends profile auto-creation so bulk user loads aren't throttled
+    # to one Profile INSERT per user. Callers are responsible for
+    # creating the missing profiles afterwards, e.g.:
+    #     Profile.objects.bulk_create(
+    #         [Profile(user_id=u.id) for u in new_users], batch_size=1000)
+    post_save.disconnect(create_profile, sender=User)
+    try:
+        yield
+    finally:
+        post_save.connect(create_profile, sender=User)
@@ -1,6 +1,8 @@
 from django.shortcuts import render, redirect
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
+from django.contrib.auth.models import User
+from django.db import transaction
 from .forms import UserRegisterForm, UserUpdateForm, ProfileUpdateForm
 
 
@@ -8,9 +10,13 @@ def register(request):
     if request.method == 'POST':
         form = UserRegisterForm(request.POST)
         if form.is_valid():
-            form.save()
-            username = form.cleaned_data.get('username')
-            messages.success(request, f'Your account has been created! You are now able to log in')
+            # User and Profile (created by the post_save signal) commit
+            # together; the message is only queued once the commit lands.
+            with transaction.atomic():
+                form.save()
+                transaction.on_commit(
+                    lambda: messages.success(request, f'Your account has been created! You are now able to log in')
+                )
             return redirect('login')
     else:
         form = UserRegisterForm()
@@ -19,11 +25,15 @@ def register(request):
 
 @login_required
 def profile(request):
+    # Fetch the user with its profile joined in one query; request.user
+    # alone would lazy-load the Profile row separately when the template
+    # renders user.profile.image.
+    user = User.objects.select_related('profile').get(pk=request.user.pk)
     if request.method == 'POST':
-        u_form = UserUpdateForm(request.POST, instance=request.user)
+        u_form = UserUpdateForm(request.POST, instance=user)
         p_form = ProfileUpdateForm(request.POST,
                                    request.FILES,
-                                   instance=request.user.profile)
+                                   instance=user.profile)
         if u_form.is_valid() and p_form.is_valid():
             u_form.save()
             p_form.save()
@@ -31,10 +41,11 @@ def profile(request):
             return redirect('profile')
 
     else:
-        u_form = UserUpdateForm(instance=request.user)
-        p_form = ProfileUpdateForm(instance=request.user.profile)
+        u_form = UserUpdateForm(instance=user)
+        p_form = ProfileUpdateForm(instance=user.profile)
 
     context = {
+        'user': user,
         'u_form': u_form,
         'p_form': p_form
     }